@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 import argparse
-import json
 import shutil
 import subprocess
 import sys
 import os
-import time
-import random
+
+from functools import lru_cache
 
 from typing import Tuple
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from .config import load_config, save_config
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
+
+from .config import (
+    json_dumps,
+    json_loads,
+    load_config,
+    load_config_readonly,
+    save_config,
+)
 from . import templates as tpl
 
 
@@ -21,11 +36,73 @@ def eprint(*args: Any) -> None:
     print(*args, file=sys.stderr)
 
 
+def write_lines(lines: List[str]) -> None:
+    # One write + flush instead of a print (and possible flush) per line.
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def run(cmd: List[str], cwd: Optional[Path] = None) -> None:
     eprint(">>", " ".join(cmd))
     subprocess.run(cmd, cwd=str(cwd) if cwd else None, check=True)
 
 
+def run_parallel(
+    cmds: List[List[str]], cwd: Optional[Path] = None, jobs: int = 1
+) -> None:
+    if jobs <= 1 or len(cmds) <= 1:
+        for cmd in cmds:
+            run(cmd, cwd=cwd)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Let every batch finish, then report the first failure in submission
+    # order so the surfaced error does not depend on thread timing.
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        futures = [ex.submit(run, cmd, cwd) for cmd in cmds]
+    for fut in futures:
+        fut.result()
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return n
+
+
+# Keep argv well under the Windows command line limit (~32k chars).
+ARGV_MAX_CHARS = 30_000
+TIDY_BATCH_SIZE = 32
+
+
+def batch_files(
+    files: List[Path], max_files: Optional[int] = None, max_chars: int = ARGV_MAX_CHARS
+) -> List[List[str]]:
+    batches: List[List[str]] = []
+    cur: List[str] = []
+    size = 0
+    for f in files:
+        s = str(f)
+        full = size + len(s) + 1 > max_chars or (
+            max_files is not None and len(cur) >= max_files
+        )
+        if cur and full:
+            batches.append(cur)
+            cur, size = [], 0
+        cur.append(s)
+        size += len(s) + 1
+    if cur:
+        batches.append(cur)
+    return batches
+
+
+@lru_cache(maxsize=None)
 def which_or_die(tool: str, name: str) -> str:
     path = shutil.which(tool)
     if not path:
@@ -42,31 +119,65 @@ def ensure_dirs(*dirs: Path) -> None:
         d.mkdir(parents=True, exist_ok=True)
 
 
-def write_if_missing(path: Path, content: str) -> None:
-    if path.exists():
-        return
-    path.write_text(content, encoding="utf-8")
+def dir_names(d: Path) -> Set[str]:
+    try:
+        with os.scandir(d) as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
 
 
-def render(template: str, **kw: Any) -> str:
-    out = template
-    for k, v in kw.items():
-        out = out.replace(f"@{k.upper()}@", str(v))
-    return out
+def write_if_missing(
+    path: Path,
+    content: Union[str, bytes],
+    listings: Optional[Dict[Path, Set[str]]] = None,
+) -> None:
+    # listings: parent dir -> names in it, filled lazily with one scandir per dir
+    if listings is None:
+        if path.exists():
+            return
+    else:
+        names = listings.get(path.parent)
+        if names is None:
+            names = listings[path.parent] = dir_names(path.parent)
+        if path.name in names:
+            return
+        names.add(path.name)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content, encoding="utf-8")
 
 
-def collect_sources(root: Path, cfg: Dict[str, Any]) -> List[Path]:
-    ex_dirs = set(cfg["format"]["exclude_dirs"])
-    exts = set(cfg["format"]["extensions"])
+def _walk(
+    dir_path: str, ex_dirs: FrozenSet[str], exts: FrozenSet[str], out: List[Path]
+) -> None:
+    # Explicit stack: excluded dirs are never opened, and only one directory
+    # handle is open at a time (no fd/recursion growth with tree depth).
+    stack = [dir_path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue  # unreadable dir: skip it, as rglob did
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in ex_dirs:
+                        stack.append(entry.path)
+                # suffix test first: it rejects most entries without touching the fs
+                elif os.path.splitext(entry.name)[1] in exts and entry.is_file():
+                    out.append(Path(entry.path))
+
+
+def collect_sources(root: Path, cfg: Mapping[str, Any]) -> List[Path]:
     sources: List[Path] = []
-    for p in root.rglob("*"):
-        if p.is_dir():
-            continue
-        if p.suffix not in exts:
-            continue
-        if any(parent.name in ex_dirs for parent in p.parents):
-            continue
-        sources.append(p)
+    _walk(
+        str(root),
+        frozenset(cfg["format"]["exclude_dirs"]),
+        frozenset(cfg["format"]["extensions"]),
+        sources,
+    )
     return sources
 
 
@@ -74,6 +185,7 @@ def build_dir_for_preset(root: Path, preset: str) -> Path:
     return root / "build" / preset
 
 
+@lru_cache(maxsize=None)
 def venv_bin_dir() -> Optional[Path]:
     prefix = Path(sys.prefix)
     for c in (prefix / "bin", prefix / "Scripts"):
@@ -82,6 +194,7 @@ def venv_bin_dir() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=None)
 def resolve_tool(name: str) -> Tuple[Optional[str], str]:
     vbin = venv_bin_dir()
     exts = [""] if os.name != "nt" else [".exe", ".bat", ".cmd", ""]
@@ -106,6 +219,47 @@ def tool_or_die(name: str, friendly: str) -> str:
     return path
 
 
+NON_RUNNABLE_EXTS = {".a", ".so", ".dylib", ".lib", ".pdb", ".obj", ".o", ".cmake"}
+WIN_RUNNABLE_EXTS = {".exe", ".bat", ".cmd"}
+
+
+def _iter_runnable(dir_path: str) -> Iterator[os.DirEntry]:
+    try:
+        it = os.scandir(dir_path)
+    except PermissionError:
+        return  # unreadable dir: skip it, as rglob did
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "CMakeFiles":
+                    yield from _iter_runnable(entry.path)
+                continue
+            if not entry.is_file():
+                continue
+            ext = os.path.splitext(entry.name)[1]
+            if ext.lower() in NON_RUNNABLE_EXTS:
+                continue
+            if os.name == "nt":
+                if ext.lower() not in WIN_RUNNABLE_EXTS:
+                    continue
+            else:
+                if ext != "":
+                    continue
+                if not os.access(entry.path, os.X_OK):
+                    continue
+            yield entry
+
+
+def newest_runnable(bdir: Path) -> Optional[Path]:
+    best_mtime = -1.0
+    best: Optional[str] = None
+    for entry in _iter_runnable(str(bdir)):
+        mtime = entry.stat().st_mtime
+        if mtime > best_mtime:
+            best_mtime, best = mtime, entry.path
+    return Path(best) if best else None
+
+
 # ---------------- Commands ----------------
 
 
@@ -119,25 +273,24 @@ def cmd_init(args: argparse.Namespace) -> None:
     cfg["project"]["name"] = name
     cfg["project"]["cxx_standard"] = int(cxxstd)
 
-    ensure_dirs(root / cfg["paths"]["src_dir"], root / cfg["paths"]["tests_dir"])
-
-    write_if_missing(root / "CMakePresets.json", tpl.TEMPL_PRESETS)
-    write_if_missing(root / ".clangd", tpl.TEMPL_CLANGD)
-    write_if_missing(root / ".clang-tidy", tpl.TEMPL_CLANG_TIDY)
-    write_if_missing(root / ".clang-format", tpl.TEMPL_CLANG_FORMAT)
-
-    write_if_missing(
-        root / "CMakeLists.txt", render(tpl.TEMPL_CMAKELISTS, name=name, cxxstd=cxxstd)
-    )
-    write_if_missing(
-        root / cfg["paths"]["src_dir"] / "main.cpp", render(tpl.TEMPL_MAIN, name=name)
+    ctx = tpl.ScaffoldCtx(
+        name=name,
+        cxxstd=int(cxxstd),
+        src_dir=cfg["paths"]["src_dir"],
+        tests_dir=cfg["paths"]["tests_dir"],
+        manifest=cfg["deps"]["manifest"] if cfg["deps"]["manager"] == "vcpkg" else "",
     )
-    write_if_missing(root / cfg["paths"]["tests_dir"] / "test_main.cpp", tpl.TEMPL_TEST)
-
-    if cfg["deps"]["manager"] == "vcpkg":
-        write_if_missing(
-            root / cfg["deps"]["manifest"], render(tpl.TEMPL_VCPKG, name=name)
-        )
+    fields = ctx._asdict()
+    targets = []
+    for relpath, payload in tpl.SCAFFOLD:
+        rel = relpath.format(**fields)
+        if rel:
+            targets.append((root / rel, payload))
+    ensure_dirs(*dict.fromkeys(path.parent for path, _ in targets))
+
+    seen: Dict[Path, Set[str]] = {}
+    for path, payload in targets:
+        write_if_missing(path, payload(ctx), seen)
 
     save_config(root, cfg)
     print("OK: init is done")
@@ -145,7 +298,7 @@ def cmd_init(args: argparse.Namespace) -> None:
 
 def cmd_configure(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     cmake = cfg["tools"]["cmake"]
     which_or_die(cmake, "cmake")
 
@@ -156,7 +309,7 @@ def cmd_configure(args: argparse.Namespace) -> None:
 
 def cmd_build(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     cmake = cfg["tools"]["cmake"]
     which_or_die(cmake, "cmake")
 
@@ -167,20 +320,25 @@ def cmd_build(args: argparse.Namespace) -> None:
     cc = bdir / "compile_commands.json"
     if cc.exists():
         root_cc = root / "compile_commands.json"
+        # Symlink under a temp name, then rename over the target (atomic swap).
+        tmp = root / f".compile_commands.json.tmp.{os.getpid()}"
         try:
-            if root_cc.exists() or root_cc.is_symlink():
-                root_cc.unlink()
-            root_cc.symlink_to(cc)
+            tmp.symlink_to(cc)
+            os.replace(tmp, root_cc)
             print("OK: symlink compile_commands.json at root.")
-        except Exception:
+        except OSError:
+            if root_cc.is_symlink():
+                root_cc.unlink()
             shutil.copy2(cc, root_cc)
             print("OK: compile_commands.json copied at root.")
+        finally:
+            tmp.unlink(missing_ok=True)
     print("OK: build done!.")
 
 
 def cmd_run(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
 
     preset = args.preset or cfg["presets"]["build"]
     bdir = build_dir_for_preset(root, preset)
@@ -193,10 +351,7 @@ def cmd_run(args: argparse.Namespace) -> None:
     # Determine target name
     target = args.target or cfg.get("run", {}).get("target") or cfg["project"]["name"]
 
-    # Strip leading "--" if user used: raider run ... -- arg1 arg2
     prog_args = list(args.args)
-    if prog_args and prog_args[0] == "--":
-        prog_args = prog_args[1:]
 
     # Candidate executable locations
     candidates = [
@@ -214,38 +369,7 @@ def cmd_run(args: argparse.Namespace) -> None:
 
     # Fallback: pick newest runnable file in build dir
     if exe is None and bdir.exists():
-        found = []
-        for p in bdir.rglob("*"):
-            if not p.is_file():
-                continue
-            if "CMakeFiles" in p.parts:
-                continue
-            if p.suffix.lower() in {
-                ".a",
-                ".so",
-                ".dylib",
-                ".lib",
-                ".pdb",
-                ".obj",
-                ".o",
-                ".cmake",
-            }:
-                continue
-
-            if os.name == "nt":
-                if p.suffix.lower() not in {".exe", ".bat", ".cmd"}:
-                    continue
-            else:
-                if p.suffix != "":
-                    continue
-                if not os.access(p, os.X_OK):
-                    continue
-
-            found.append(p)
-
-        if found:
-            found.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            exe = found[0]
+        exe = newest_runnable(bdir)
 
     if exe is None:
         raise SystemExit(
@@ -261,7 +385,7 @@ def cmd_run(args: argparse.Namespace) -> None:
 
 def cmd_test(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     ctest = cfg["tools"]["ctest"]
     which_or_die(ctest, "ctest")
 
@@ -272,7 +396,7 @@ def cmd_test(args: argparse.Namespace) -> None:
 
 def cmd_fmt(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     clang_format = cfg["tools"]["clang_format"]
     which_or_die(clang_format, "clang-format")
 
@@ -281,14 +405,16 @@ def cmd_fmt(args: argparse.Namespace) -> None:
         print("No file to format!")
         return
 
-    for f in files:
-        run([clang_format, "-i", str(f)], cwd=root)
+    jobs = args.jobs or default_jobs()
+    per_job = -(-len(files) // jobs)
+    cmds = [[clang_format, "-i", *b] for b in batch_files(files, max_files=per_job)]
+    run_parallel(cmds, cwd=root, jobs=jobs)
     print(f"OK: {len(files)} file(s) formated.")
 
 
 def cmd_tidy(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     clang_tidy = cfg["tools"]["clang_tidy"]
     which_or_die(clang_tidy, "clang-tidy")
 
@@ -305,17 +431,21 @@ def cmd_tidy(args: argparse.Namespace) -> None:
         print("No file to analyze")
         return
 
-    for f in files:
-        run([clang_tidy, str(f), "-p", str(bdir)], cwd=root)
+    jobs = args.jobs or default_jobs()
+    per_job = min(TIDY_BATCH_SIZE, -(-len(files) // jobs))
+    cmds = [
+        [clang_tidy, "-p", str(bdir), *b] for b in batch_files(files, max_files=per_job)
+    ]
+    run_parallel(cmds, cwd=root, jobs=jobs)
     print(f"OK: tidy check done in {len(files)} file(s).")
 
 
 def read_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json_loads(path.read_bytes())
 
 
 def write_json(path: Path, obj: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    path.write_bytes(json_dumps(obj))
 
 
 def cmd_deps_bootstrap(args: argparse.Namespace) -> None:
@@ -337,10 +467,14 @@ def cmd_deps_bootstrap(args: argparse.Namespace) -> None:
         print(f"vcpkg already in: {dest}")
     else:
         dest.parent.mkdir(parents=True, exist_ok=True)
-        run(
-            [git, "clone", "https://github.com/microsoft/vcpkg.git", str(dest)],
-            cwd=root,
+        # Only the tip is needed to bootstrap; --full-history keeps versioning data.
+        shallow = (
+            []
+            if args.full_history
+            else ["--depth", "1", "--filter=blob:none", "--single-branch"]
         )
+        url = "https://github.com/microsoft/vcpkg.git"
+        run([git, "clone", *shallow, url, str(dest)], cwd=root)
 
     # Bootstrap (Windows vs Unix)
     if os.name == "nt":
@@ -369,7 +503,7 @@ def cmd_deps_bootstrap(args: argparse.Namespace) -> None:
 
 def cmd_deps_add(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     if cfg["deps"]["manager"] != "vcpkg":
         raise SystemExit(
             "deps add/remove(WIP) only supports vcpkg manifest (vcpkg.json)."
@@ -396,7 +530,7 @@ def cmd_deps_add(args: argparse.Namespace) -> None:
 
 def cmd_deps_remove(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
     if cfg["deps"]["manager"] != "vcpkg":
         raise SystemExit(
             "deps add/remove(WIP) only supports vcpkg manifest (vcpkg.json)."
@@ -423,7 +557,7 @@ def cmd_deps_remove(args: argparse.Namespace) -> None:
 
 def cmd_check(args: argparse.Namespace) -> None:
     root = project_root()
-    cfg = load_config(root)
+    cfg = load_config_readonly(root)
 
     checks = [
         ("cmake", "CMake"),
@@ -456,7 +590,6 @@ def cmd_check(args: argparse.Namespace) -> None:
 
 
 def cmd_raid_ready(args: argparse.Namespace) -> None:
-    print("=== RAID READY CHECK ===")
     checks = [
         "Repair (100%)",
         "Talents/Spec correct",
@@ -466,13 +599,16 @@ def cmd_raid_ready(args: argparse.Namespace) -> None:
         "Enchants/Gems ok",
         "Rune + Flask + Food ok",
     ]
-    for c in checks:
-        print(f" - [X] {c}")
-    print("\n✅ Type 'raider raid consumes' for consumables checklist.")
+    write_lines(
+        [
+            "=== RAID READY CHECK ===",
+            *(f" - [X] {c}" for c in checks),
+            "\n✅ Type 'raider raid consumes' for consumables checklist.",
+        ]
+    )
 
 
 def cmd_raid_consumes(args: argparse.Namespace) -> None:
-    print("=== CONSUMABLES CHECKLIST ===")
     items = [
         "Flask",
         "Food (feast/personal)",
@@ -484,12 +620,17 @@ def cmd_raid_consumes(args: argparse.Namespace) -> None:
         "Tomes",
         "Vantus rune",
     ]
-    for it in items:
-        print(f" - [X] {it}")
-    print("\n💡 Tip: keep 2+ stacks of pots for prog nights.")
+    write_lines(
+        [
+            "=== CONSUMABLES CHECKLIST ===",
+            *(f" - [X] {it}" for it in items),
+            "\n💡 Tip: keep 2+ stacks of pots for prog nights.",
+        ]
+    )
 
 
 def cmd_raid_pull(args: argparse.Namespace) -> None:
+    import time
 
     sec = int(args.seconds)
     if sec <= 0:
@@ -498,17 +639,29 @@ def cmd_raid_pull(args: argparse.Namespace) -> None:
 
     print(f"=== PULL IN {sec} ===")
 
-    for t in range(sec, 0, -1):
+    # Sleep to absolute per-tick deadlines so print/flush time does not accumulate.
+    start = time.monotonic()
+    for i, t in enumerate(range(sec, 0, -1), start=1):
         print(f"\x1b[2K\rPull in... {t}", end="", flush=True)
-        time.sleep(1)
+        delay = start + i - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
 
     print("\x1b[2K\rPULL NOW!      ")
 
 
+# Meter bars are sliced from these instead of rebuilt per row.
+_BAR_MAX = 512
+_FULL_BAR = "█" * _BAR_MAX
+_EMPTY_BAR = "░" * _BAR_MAX
+
+
 def cmd_raid_meters(args: argparse.Namespace) -> None:
+    import random
+    import time
 
-    if args.seed is not None:
-        random.seed(args.seed)
+    # Private generator: no global RNG state, and None still means "unseeded".
+    rng = random.Random(args.seed)
 
     # Some fun names/specs (edit as you like)
     roster = [
@@ -538,20 +691,21 @@ def cmd_raid_meters(args: argparse.Namespace) -> None:
         ("Lilchking", "Blood DK"),
     ]
 
-    width = max(10, int(args.width))
+    width = min(_BAR_MAX, max(10, int(args.width)))
 
     # Pick 5 unique players
-    picks = random.sample(roster, 5)
+    n = 5
+    picks = rng.sample(roster, n)
 
     # Make DPS numbers: "top" somewhere 180k-260k, others 60-220k
-    base = random.randint(180_000, 260_000)
-    dps_list = []
-    for i, (name, spec) in enumerate(picks):
-        # falloff per rank + some noise
-        drop = i * random.randint(12_000, 28_000)
-        noise = random.randint(-8_000, 10_000)
-        dps = max(25_000, base - drop + noise)
-        dps_list.append((name, spec, dps))
+    base = rng.randint(180_000, 260_000)
+    # falloff per rank + some noise, drawn up front
+    drops = [rng.randint(12_000, 28_000) for _ in range(n)]
+    noise = [rng.randint(-8_000, 10_000) for _ in range(n)]
+    dps_list = [
+        (name, spec, max(25_000, base - i * drops[i] + noise[i]))
+        for i, (name, spec) in enumerate(picks)
+    ]
 
     # Sort highest first
     dps_list.sort(key=lambda x: x[2], reverse=True)
@@ -559,7 +713,7 @@ def cmd_raid_meters(args: argparse.Namespace) -> None:
     top_dps = dps_list[0][2]
 
     # Fake fight metadata
-    boss = random.choice(
+    boss = rng.choice(
         [
             "Patchwerk",
             "The Jailer",
@@ -574,22 +728,26 @@ def cmd_raid_meters(args: argparse.Namespace) -> None:
             "Council of Blood",
         ]
     )
-    duration = random.randint(240, 540)  # 4-9 min
+    duration = rng.randint(240, 540)  # 4-9 min
     ts = time.strftime("%H:%M:%S")
 
-    print(f"=== Details! Damage Done (Top 5) ===  [{ts}]")
-    print(f"Fight: {boss}  |  Duration: {duration // 60}:{duration % 60:02d}")
-    print("-" * (width + 38))
+    sep = "-" * (width + 38)
+    lines = [
+        f"=== Details! Damage Done (Top 5) ===  [{ts}]",
+        f"Fight: {boss}  |  Duration: {duration // 60}:{duration % 60:02d}",
+        sep,
+    ]
 
     # Render bars
     for rank, (name, spec, dps) in enumerate(dps_list, start=1):
         frac = dps / top_dps if top_dps else 0.0
         filled = int(round(frac * width))
-        bar = "█" * filled + "░" * (width - filled)
-        print(f"{rank:>2}. {name:<10} ({spec:<13})  {dps / 1000:>6.1f}k  {bar}")
+        bar = _FULL_BAR[:filled] + _EMPTY_BAR[: width - filled]
+        lines.append(f"{rank:>2}. {name:<10} ({spec:<13})  {dps / 1000:>6.1f}k  {bar}")
 
-    print("-" * (width + 38))
-    print("Tip: blame priest for not giving PI")
+    lines.append(sep)
+    lines.append("Tip: blame priest for not giving PI")
+    write_lines(lines)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -614,7 +772,14 @@ def build_parser() -> argparse.ArgumentParser:
     p_bld.add_argument("--preset", type=str, default=None)
     p_bld.set_defaults(func=cmd_build)
 
-    p_run = sub.add_parser("run", help="Run the preset binary (dev/rel/etc)")
+    p_run = sub.add_parser(
+        "run",
+        help="Run the preset binary (dev/rel/etc)",
+        usage="raider run [-h] [--preset PRESET] [--target TARGET] [--build]"
+        " [-- ARGS ...]",
+        epilog="Everything after '--' is passed unchanged to the program, "
+        "e.g. raider run --preset dev -- --verbose input.txt",
+    )
     p_run.add_argument("--preset", type=str, default=None, help="Preset (dev/rel/...)")
     p_run.add_argument(
         "--target",
@@ -623,24 +788,34 @@ def build_parser() -> argparse.ArgumentParser:
         help="Executable name/target (default: config.run.target or project.name)",
     )
     p_run.add_argument("--build", action="store_true", help="Build before running")
-    p_run.add_argument(
-        "args",
-        nargs=argparse.REMAINDER,
-        help="Args after '--' pass to program",
-    )
-    p_run.set_defaults(func=cmd_run)
+    # Program args after '--' are split off in main(), argparse never sees them.
+    p_run.set_defaults(func=cmd_run, args=[])
 
     p_tst = sub.add_parser("test", help="ctest --preset <preset>")
     p_tst.add_argument("--preset", type=str, default=None)
     p_tst.set_defaults(func=cmd_test)
 
     p_fmt = sub.add_parser("fmt", help="clang-format -i in sources")
+    p_fmt.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Parallel jobs (default: CPUs)",
+    )
     p_fmt.set_defaults(func=cmd_fmt)
 
     p_tidy = sub.add_parser(
         "tidy", help="clang-tidy using compile_commands from preset"
     )
     p_tidy.add_argument("--preset", type=str, default=None)
+    p_tidy.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="Parallel jobs (default: CPUs)",
+    )
     p_tidy.set_defaults(func=cmd_tidy)
 
     p_deps = sub.add_parser("deps", help="deps add/remove (WIP: vcpkg.json)")
@@ -660,6 +835,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Destination dir (default: deps.vcpkg_root)",
     )
+    p_boot.add_argument(
+        "--full-history",
+        action="store_true",
+        help="Full vcpkg clone (needed for builtin-baseline/versioning)",
+    )
     p_boot.set_defaults(func=cmd_deps_bootstrap)
 
     p_add = deps_sub.add_parser("add", help="add pkg in vcpkg.json")
@@ -693,6 +873,17 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
-def main() -> None:
-    args = build_parser().parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    tail: List[str] = []
+    if "--" in argv:
+        sep = argv.index("--")
+        argv, tail = argv[:sep], argv[sep + 1 :]
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if tail:
+        if args.func is not cmd_run:
+            parser.error("'--' pass-through args are only supported by 'run'")
+        args.args = tail
     args.func(args)
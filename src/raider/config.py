@@ -1,8 +1,29 @@
 from __future__ import annotations
 
+import copy
 import json
+from collections import ChainMap
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: pip install raider[fast]
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "project": {"name": "raider-proj", "cxx_standard": 20},
@@ -28,14 +49,35 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
 CONFIG_FILENAME = "raider.json"
 
+# (mtime_ns, size), parsed user config, frozen copy of it. The parsed dict is
+# never handed out: load_config merges a deep copy of it and
+# load_config_readonly reads the frozen copy.
+_CachedConfig = Tuple[Tuple[int, int], Dict[str, Any], Mapping[str, Any]]
+_CONFIG_CACHE: Dict[Path, _CachedConfig] = {}
+
+
+def _freeze(obj: Any) -> Any:
+    # dicts -> read-only proxies, lists -> tuples, all the way down.
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+_FROZEN_DEFAULTS: Mapping[str, Any] = _freeze(DEFAULT_CONFIG)
+
 
 def deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(dst)
-    for k, v in src.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = deep_merge(out[k], v)
-        else:
-            out[k] = v
+    out = copy.deepcopy(dst)
+    stack = [(out, src)]
+    while stack:
+        d, s = stack.pop()
+        for k, v in s.items():
+            if isinstance(v, dict) and isinstance(d.get(k), dict):
+                stack.append((d[k], v))
+            else:
+                d[k] = v
     return out
 
 
@@ -43,14 +85,44 @@ def config_path(root: Path) -> Path:
     return root / CONFIG_FILENAME
 
 
+def _cached_user_config(path: Path) -> _CachedConfig:
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached
+    user_cfg = json_loads(path.read_bytes())
+    cached = _CONFIG_CACHE[path] = (key, user_cfg, _freeze(user_cfg))
+    return cached
+
+
 def load_config(root: Path) -> Dict[str, Any]:
     path = config_path(root)
     if not path.exists():
-        return json.loads(json.dumps(DEFAULT_CONFIG))
-    user_cfg = json.loads(path.read_text(encoding="utf-8"))
-    return deep_merge(DEFAULT_CONFIG, user_cfg)
+        return copy.deepcopy(DEFAULT_CONFIG)
+    # deep_merge copies the defaults but links src values in, so merge a copy.
+    return deep_merge(DEFAULT_CONFIG, copy.deepcopy(_cached_user_config(path)[1]))
+
+
+def load_config_readonly(root: Path) -> Mapping[str, Any]:
+    # Same keys and values as load_config(), without the merge/copy: sections
+    # that are dicts on both sides resolve user keys first, then defaults; any
+    # other user value (extra sections, non-dict overrides) is used as is.
+    # Everything is frozen (dicts are read-only, lists are tuples); use
+    # load_config() when the result will be modified and saved.
+    path = config_path(root)
+    user_cfg = _cached_user_config(path)[2] if path.exists() else _FROZEN_DEFAULTS
+    out = dict(user_cfg)
+    for k, default in _FROZEN_DEFAULTS.items():
+        sec = out.get(k, default)
+        if sec is not default and isinstance(sec, Mapping):
+            out[k] = ChainMap(sec, default)
+        else:
+            out.setdefault(k, default)
+    return MappingProxyType(out)
 
 
 def save_config(root: Path, cfg: Dict[str, Any]) -> None:
     path = config_path(root)
-    path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    path.write_bytes(json_dumps(cfg))
+    _CONFIG_CACHE.pop(path, None)
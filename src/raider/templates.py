@@ -1,5 +1,24 @@
 from __future__ import annotations
 
+import copy
+import re
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Tuple
+
+from .config import json_loads
+
+# @NAME@ placeholders: ${...} already belongs to CMake and CMakePresets.
+_TOKEN_RE = re.compile(r"@([A-Z_][A-Z0-9_]*)@")
+
+
+def render(tmpl: str, mapping: Mapping[str, str]) -> str:
+    # Single pass over the template, whatever the number of placeholders.
+    return _TOKEN_RE.sub(lambda m: mapping[m.group(1)], tmpl)
+
+
+# Parametric templates: render with render(TEMPL_X, {"NAME": ...}).
 TEMPL_CMAKELISTS = r"""cmake_minimum_required(VERSION 3.20)
 project(@NAME@ LANGUAGES CXX)
 
@@ -80,11 +99,106 @@ TEMPL_PRESETS = r"""{
 }
 """
 
+
+@lru_cache(maxsize=None)
+def _presets_parsed() -> Dict[str, Any]:
+    return json_loads(TEMPL_PRESETS.encode("utf-8"))
+
+
+def presets_obj() -> Dict[str, Any]:
+    # TEMPL_PRESETS parsed once; each caller gets its own copy to modify.
+    # Write TEMPL_PRESETS itself when the hand-formatted layout should be kept.
+    return copy.deepcopy(_presets_parsed())
+
+
 TEMPL_CLANGD = r"""CompileFlags:
   Add: [-Wall, -Wextra, -Wpedantic]
 """
 
-TEMPL_CLANG_TIDY = r"""---
+# readability-identifier-naming options: every kind is lower_case unless
+# overridden below; prefixes are emitted right after their kind's Case entry.
+_NAMING_KINDS = (
+    "AbstractClass",
+    "Class",
+    "ClassConstant",
+    "ClassMember",
+    "ClassMethod",
+    "Constant",
+    "ConstantMember",
+    "ConstantParameter",
+    "ConstantPointerParameter",
+    "ConstexprFunction",
+    "ConstexprMethod",
+    "ConstexprVariable",
+    "Enum",
+    "EnumConstant",
+    "Function",
+    "GlobalConstant",
+    "GlobalConstantPointer",
+    "GlobalFunction",
+    "GlobalPointer",
+    "GlobalVariable",
+    "InlineNamespace",
+    "LocalConstant",
+    "LocalConstantPointer",
+    "LocalPointer",
+    "LocalVariable",
+    "MacroDefinition",
+    "Member",
+    "Method",
+    "Namespace",
+    "Parameter",
+    "ParameterPack",
+    "PointerParameter",
+    "PrivateMember",
+    "PrivateMethod",
+    "ProtectedMember",
+    "ProtectedMethod",
+    "PublicMember",
+    "PublicMethod",
+    "ScopedEnumConstant",
+    "StaticConstant",
+    "StaticVariable",
+    "Struct",
+    "TemplateParameter",
+    "TemplateTemplateParameter",
+    "TypeAlias",
+    "Typedef",
+    "TypeTemplateParameter",
+    "Union",
+    "ValueTemplateParameter",
+    "Variable",
+    "VirtualMethod",
+)
+_NAMING_CASE_OVERRIDES: Mapping[str, str] = MappingProxyType(
+    {
+        "MacroDefinition": "UPPER_CASE",
+        "TemplateParameter": "CamelCase",
+        "TemplateTemplateParameter": "CamelCase",
+        "TypeTemplateParameter": "CamelCase",
+        "ValueTemplateParameter": "CamelCase",
+    }
+)
+_NAMING_PREFIXES: Mapping[str, str] = MappingProxyType(
+    {"PrivateMember": "m_", "ProtectedMember": "m_"}
+)
+
+
+def _naming_option(key: str, value: str) -> str:
+    return f"  - key: 'readability-identifier-naming.{key}'\n    value: '{value}'\n"
+
+
+def _naming_options() -> str:
+    out = []
+    for kind in _NAMING_KINDS:
+        case = _NAMING_CASE_OVERRIDES.get(kind, "lower_case")
+        out.append(_naming_option(f"{kind}Case", case))
+        if kind in _NAMING_PREFIXES:
+            out.append(_naming_option(f"{kind}Prefix", _NAMING_PREFIXES[kind]))
+    return "".join(out)
+
+
+_CLANG_TIDY_HEAD = r"""---
 # Enable ALL the things! Except not really
 # misc-non-private-member-variables-in-classes: the options don't do anything
 # modernize-use-nodiscard: too aggressive, attribute is situationally useful
@@ -133,391 +247,12 @@ CheckOptions:
   - key: 'readability-redundant-access-specifiers.CheckFirstDeclaration'
     value: 'true'
 # These seem to be the most common identifier styles
-  - key: 'readability-identifier-naming.AbstractClassCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ClassCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ClassConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ClassMemberCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ClassMethodCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstantMemberCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstantParameterCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstantPointerParameterCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstexprFunctionCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstexprMethodCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ConstexprVariableCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.EnumCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.EnumConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.FunctionCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.GlobalConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.GlobalConstantPointerCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.GlobalFunctionCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.GlobalPointerCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.GlobalVariableCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.InlineNamespaceCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.LocalConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.LocalConstantPointerCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.LocalPointerCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.LocalVariableCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.MacroDefinitionCase'
-    value: 'UPPER_CASE'
-  - key: 'readability-identifier-naming.MemberCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.MethodCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.NamespaceCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ParameterCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ParameterPackCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.PointerParameterCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.PrivateMemberCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.PrivateMemberPrefix'
-    value: 'm_'
-  - key: 'readability-identifier-naming.PrivateMethodCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ProtectedMemberCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ProtectedMemberPrefix'
-    value: 'm_'
-  - key: 'readability-identifier-naming.ProtectedMethodCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.PublicMemberCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.PublicMethodCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ScopedEnumConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.StaticConstantCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.StaticVariableCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.StructCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.TemplateParameterCase'
-    value: 'CamelCase'
-  - key: 'readability-identifier-naming.TemplateTemplateParameterCase'
-    value: 'CamelCase'
-  - key: 'readability-identifier-naming.TypeAliasCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.TypedefCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.TypeTemplateParameterCase'
-    value: 'CamelCase'
-  - key: 'readability-identifier-naming.UnionCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.ValueTemplateParameterCase'
-    value: 'CamelCase'
-  - key: 'readability-identifier-naming.VariableCase'
-    value: 'lower_case'
-  - key: 'readability-identifier-naming.VirtualMethodCase'
-    value: 'lower_case'
-...
 """
 
-TEMPL_CLANG_FORMAT = r"""---
-Language: Cpp
-AccessModifierOffset: -4
-AlignAfterOpenBracket: Align
-AlignArrayOfStructures: Left
-AlignConsecutiveAssignments:
-  Enabled: true
-  AcrossEmptyLines: false
-  AcrossComments: false
-  AlignCompound: false
-  AlignFunctionPointers: true
-  PadOperators: true
-AlignConsecutiveBitFields:
-  Enabled: true
-  AcrossEmptyLines: false
-  AcrossComments: false
-  AlignCompound: false
-  AlignFunctionPointers: true
-  PadOperators: true
-AlignConsecutiveDeclarations:
-  Enabled: true
-  AcrossEmptyLines: false
-  AcrossComments: false
-  AlignCompound: false
-  AlignFunctionPointers: true
-  PadOperators: true
-AlignConsecutiveMacros:
-  Enabled: true
-  AcrossEmptyLines: false
-  AcrossComments: false
-  AlignCompound: false
-  AlignFunctionPointers: true
-  PadOperators: true
-AlignConsecutiveShortCaseStatements:
-  Enabled: false
-  AcrossEmptyLines: false
-  AcrossComments: false
-  AlignCaseColons: false
-AlignEscapedNewlines: DontAlign
-AlignOperands: DontAlign
-AlignTrailingComments: Always
-AllowAllArgumentsOnNextLine: true
-AllowAllParametersOfDeclarationOnNextLine: true
-AllowBreakBeforeNoexceptSpecifier: OnlyWithParen
-AllowShortBlocksOnASingleLine: Empty
-AllowShortCaseLabelsOnASingleLine: false
-AllowShortCompoundRequirementOnASingleLine: true
-AllowShortEnumsOnASingleLine: false
-AllowShortFunctionsOnASingleLine: Inline
-AllowShortIfStatementsOnASingleLine: Never
-AllowShortLambdasOnASingleLine: All
-AllowShortLoopsOnASingleLine: false
-AlwaysBreakAfterDefinitionReturnType: None
-AlwaysBreakAfterReturnType: None
-AlwaysBreakBeforeMultilineStrings: true
-AlwaysBreakTemplateDeclarations: Yes
-AttributeMacros:
-  - __capability
-BinPackArguments: false
-BinPackParameters: false
-BitFieldColonSpacing: Both
-BraceWrapping:
-  AfterCaseLabel: false
-  AfterClass: true
-  AfterControlStatement: MultiLine
-  AfterEnum: true
-  AfterExternBlock: true
-  AfterFunction: true
-  AfterNamespace: true
-  AfterObjCDeclaration: false
-  AfterStruct: true
-  AfterUnion: true
-  BeforeCatch: false
-  BeforeElse: false
-  BeforeLambdaBody: true
-  BeforeWhile: false
-  IndentBraces: false
-  SplitEmptyFunction: true
-  SplitEmptyRecord: true
-  SplitEmptyNamespace: true
-BreakAdjacentStringLiterals: false
-BreakAfterAttributes: Leave
-BreakAfterJavaFieldAnnotations: true
-BreakArrays: true
-BreakBeforeBinaryOperators: NonAssignment
-BreakBeforeConceptDeclarations: Always
-BreakBeforeBraces: Custom
-BreakBeforeInlineASMColon: OnlyMultiline
-BreakBeforeTernaryOperators: true
-BreakConstructorInitializers: BeforeComma
-BreakInheritanceList: BeforeComma
-BreakStringLiterals: true
-ColumnLimit: 120
-CommentPragmas: '^ IWYU pragma:'
-CompactNamespaces: false
-ConstructorInitializerIndentWidth: 4
-ContinuationIndentWidth: 4
-Cpp11BracedListStyle: true
-DerivePointerAlignment: false
-DisableFormat: false
-EmptyLineAfterAccessModifier: Never
-EmptyLineBeforeAccessModifier: LogicalBlock
-ExperimentalAutoDetectBinPacking: false
-FixNamespaceComments: true
-ForEachMacros:
-  - foreach
-  - Q_FOREACH
-  - BOOST_FOREACH
-IfMacros:
-  - KJ_IF_MAYBE
-IncludeBlocks: Regroup
-IncludeCategories:
-  # Standard library headers come before anything else
-  - Regex: '^<[a-z_]+>'
-    Priority: -1
-    SortPriority: 0
-    CaseSensitive: false
-  - Regex: '^<.+\.h(pp)?>'
-    Priority: 1
-    SortPriority: 0
-    CaseSensitive: false
-  - Regex: '^<.*'
-    Priority: 2
-    SortPriority: 0
-    CaseSensitive: false
-  - Regex: '.*'
-    Priority: 3
-    SortPriority: 0
-    CaseSensitive: false
-IncludeIsMainRegex: ''
-IncludeIsMainSourceRegex: ''
-IndentAccessModifiers: false
-IndentCaseBlocks: false
-IndentCaseLabels: true
-IndentExternBlock: NoIndent
-IndentGotoLabels: true
-IndentPPDirectives: AfterHash
-IndentRequiresClause: true
-IndentWidth: 4
-IndentWrappedFunctionNames: false
-InsertBraces: true
-InsertNewlineAtEOF: true
-InsertTrailingCommas: Wrapped
-IntegerLiteralSeparator:
-  Binary: 0
-  BinaryMinDigits: 0
-  Decimal: 0
-  DecimalMinDigits: 0
-  Hex: 0
-  HexMinDigits: 0
-JavaScriptQuotes: Double
-JavaScriptWrapImports: true
-KeepEmptyLinesAtTheStartOfBlocks: false
-KeepEmptyLinesAtEOF: false
-LambdaBodyIndentation: Signature
-LineEnding: LF
-MacroBlockBegin: ''
-MacroBlockEnd: ''
-MaxEmptyLinesToKeep: 1
-NamespaceIndentation: None
-ObjCBinPackProtocolList: Never
-ObjCBlockIndentWidth: 2
-ObjCBreakBeforeNestedBlockParam: true
-ObjCSpaceAfterProperty: false
-ObjCSpaceBeforeProtocolList: true
-PackConstructorInitializers: Never
-PenaltyBreakAssignment: 2
-PenaltyBreakBeforeFirstCallParameter: 1
-PenaltyBreakComment: 300
-PenaltyBreakFirstLessLess: 120
-PenaltyBreakOpenParenthesis: 0
-PenaltyBreakScopeResolution: 500
-PenaltyBreakString: 1000
-PenaltyBreakTemplateDeclaration: 10
-PenaltyExcessCharacter: 1000000
-PenaltyIndentedWhitespace: 0
-PenaltyReturnTypeOnItsOwnLine: 200
-PointerAlignment: Right
-PPIndentWidth: -1
-QualifierAlignment: Leave
-RawStringFormats:
-  - Language: Cpp
-    Delimiters:
-      - cc
-      - CC
-      - cpp
-      - Cpp
-      - CPP
-      - 'c++'
-      - 'C++'
-    CanonicalDelimiter: ''
-    BasedOnStyle: google
-  - Language: TextProto
-    Delimiters:
-      - pb
-      - PB
-      - proto
-      - PROTO
-    EnclosingFunctions:
-      - EqualsProto
-      - EquivToProto
-      - PARSE_PARTIAL_TEXT_PROTO
-      - PARSE_TEST_PROTO
-      - PARSE_TEXT_PROTO
-      - ParseTextOrDie
-      - ParseTextProtoOrDie
-      - ParseTestProto
-      - ParsePartialTestProto
-    CanonicalDelimiter: ''
-    BasedOnStyle: google
-ReferenceAlignment: Pointer
-ReflowComments: true
-RemoveBracesLLVM: false
-RemoveParentheses: Leave
-RemoveSemicolon: false
-RequiresClausePosition: OwnLine
-RequiresExpressionIndentation: OuterScope
-SeparateDefinitionBlocks: Always
-ShortNamespaceLines: 1
-SkipMacroDefinitionBody: false
-SortIncludes: CaseSensitive
-SortJavaStaticImport: Before
-SortUsingDeclarations: LexicographicNumeric
-SpaceAfterCStyleCast: false
-SpaceAfterLogicalNot: false
-SpaceAfterTemplateKeyword: false
-SpaceAroundPointerQualifiers: Default
-SpaceBeforeAssignmentOperators: true
-SpaceBeforeCaseColon: false
-SpaceBeforeCpp11BracedList: true
-SpaceBeforeCtorInitializerColon: true
-SpaceBeforeInheritanceColon: true
-SpaceBeforeJsonColon: false
-SpaceBeforeParens: ControlStatementsExceptControlMacros
-SpaceBeforeParensOptions:
-  AfterControlStatements: true
-  AfterForeachMacros: false
-  AfterFunctionDefinitionName: false
-  AfterFunctionDeclarationName: false
-  AfterIfMacros: false
-  AfterOverloadedOperator: false
-  AfterPlacementOperator: true
-  AfterRequiresInClause: false
-  AfterRequiresInExpression: false
-  BeforeNonEmptyParentheses: false
-SpaceBeforeRangeBasedForLoopColon: true
-SpaceBeforeSquareBrackets: false
-SpaceInEmptyBlock: false
-SpacesBeforeTrailingComments: 2
-SpacesInAngles: Never
-SpacesInContainerLiterals: false
-SpacesInLineCommentPrefix:
-  Minimum: 1
-  Maximum: -1
-SpacesInParens: Never
-SpacesInParensOptions:
-  InCStyleCasts: false
-  InConditionalStatements: false
-  InEmptyParentheses: false
-  Other: false
-SpacesInSquareBrackets: false
-Standard: Auto
-StatementAttributeLikeMacros:
-  - Q_EMIT
-StatementMacros:
-  - Q_UNUSED
-  - QT_REQUIRE_VERSION
-TabWidth: 4
-UseTab: Never
-VerilogBreakBetweenInstancePorts: true
-WhitespaceSensitiveMacros:
-  - STRINGIZE
-  - PP_STRINGIZE
-  - BOOST_PP_STRINGIZE
-...
-"""
+
+def _clang_tidy() -> str:
+    return _CLANG_TIDY_HEAD + _naming_options() + "...\n"
+
 
 TEMPL_VCPKG = r"""{
   "name": "@NAME@",
@@ -525,3 +260,94 @@ TEMPL_VCPKG = r"""{
   "dependencies": []
 }
 """
+
+
+# Render helpers for the parametric templates.
+def cmakelists(name: str, cxxstd: int) -> str:
+    return render(TEMPL_CMAKELISTS, {"NAME": name, "CXXSTD": str(cxxstd)})
+
+
+def main_cpp(name: str) -> str:
+    return render(TEMPL_MAIN, {"NAME": name})
+
+
+def vcpkg_manifest(name: str) -> str:
+    return render(TEMPL_VCPKG, {"NAME": name})
+
+
+def _lint_tokens() -> None:
+    # Render each template once through its own helper at import, so a token
+    # the helper does not supply fails here rather than on the first init.
+    try:
+        cmakelists("lint", 0)
+        main_cpp("lint")
+        vcpkg_manifest("lint")
+    except KeyError as e:
+        raise RuntimeError(f"unknown template token @{e.args[0]}@") from None
+
+
+_lint_tokens()
+
+
+def _data(name: str) -> bytes:
+    # Static config files shipped as package data (src/raider/data/). Imported
+    # here: importlib.resources pulls in tempfile/random at startup otherwise.
+    from importlib import resources
+
+    return (resources.files(__package__) / "data" / name).read_bytes()
+
+
+# Rarely used / derived templates are materialized on first attribute access
+# (PEP 562) and then cached as plain module globals.
+_LAZY: Mapping[str, Callable[[], Any]] = MappingProxyType(
+    {
+        "TEMPL_CLANG_TIDY": _clang_tidy,
+        "TEMPL_CLANG_FORMAT": lambda: _get("TEMPL_CLANG_FORMAT_BYTES").decode("utf-8"),
+        # Constant templates pre-encoded for write_bytes.
+        "TEMPL_PRESETS_BYTES": lambda: TEMPL_PRESETS.encode("utf-8"),
+        "TEMPL_CLANGD_BYTES": lambda: TEMPL_CLANGD.encode("utf-8"),
+        "TEMPL_CLANG_TIDY_BYTES": lambda: _get("TEMPL_CLANG_TIDY").encode("utf-8"),
+        "TEMPL_CLANG_FORMAT_BYTES": lambda: _data("clang-format.yaml"),
+        "TEMPL_TEST_BYTES": lambda: TEMPL_TEST.encode("utf-8"),
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        factory = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = factory()
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
+
+
+def _get(name: str) -> Any:
+    g = globals()
+    return g[name] if name in g else __getattr__(name)
+
+
+class ScaffoldCtx(NamedTuple):
+    name: str
+    cxxstd: int
+    src_dir: str
+    tests_dir: str
+    manifest: str  # "" when the project does not use a vcpkg manifest
+
+
+# Files written by `raider init`, in order: (relpath format, payload factory).
+# Constant payloads are the cached *_BYTES; a relpath formatting to "" is skipped.
+SCAFFOLD: Tuple[Tuple[str, Callable[[ScaffoldCtx], bytes]], ...] = (
+    ("CMakePresets.json", lambda c: _get("TEMPL_PRESETS_BYTES")),
+    (".clangd", lambda c: _get("TEMPL_CLANGD_BYTES")),
+    (".clang-tidy", lambda c: _get("TEMPL_CLANG_TIDY_BYTES")),
+    (".clang-format", lambda c: _get("TEMPL_CLANG_FORMAT_BYTES")),
+    ("CMakeLists.txt", lambda c: cmakelists(c.name, c.cxxstd).encode("utf-8")),
+    ("{src_dir}/main.cpp", lambda c: main_cpp(c.name).encode("utf-8")),
+    ("{tests_dir}/test_main.cpp", lambda c: _get("TEMPL_TEST_BYTES")),
+    ("{manifest}", lambda c: vcpkg_manifest(c.name).encode("utf-8")),
+)